@@ -5,6 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 import sys
 
+import pyarrow as pa
+import pyarrow.dataset as ds
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -13,6 +16,13 @@ from src.data_fetch import download_binance_1m_klines  # noqa: E402
 from src.features import compute_features  # noqa: E402
 from src.utils import data_path, load_binance_zip_files  # noqa: E402
 
+PROCESSED_PARTITIONING = ds.partitioning(
+    pa.schema(
+        [("symbol", pa.string()), ("year", pa.int32()), ("month", pa.int32())]
+    ),
+    flavor="hive",
+)
+
 
 def main() -> None:
     """Run baseline data ingestion and feature preparation."""
@@ -33,9 +43,32 @@ def main() -> None:
     raw_df = load_binance_zip_files(archives)
     feature_df = compute_features(raw_df)
 
-    month_label = f"{months[0]:02d}_{months[-1]:02d}"
-    out_file = data_path("processed") / f"{symbol}-1m-{year}-{month_label}-features.parquet"
-    feature_df.to_parquet(out_file, index=False)
+    out_dir = data_path("processed")
+    feature_df["symbol"] = symbol
+    feature_df["year"] = feature_df["open_time"].dt.year.astype("int32")
+    feature_df["month"] = feature_df["open_time"].dt.month.astype("int32")
+
+    # Hive-partitioned layout (processed/symbol=.../year=.../month=...)
+    # lets future multi-symbol or multi-year queries prune whole
+    # partitions before touching a file. Moderate row groups +
+    # per-column statistics let readers project columns and prune on
+    # open_time ranges; zstd at a low level keeps decode cheap on local
+    # NVMe while beating snappy on size.
+    ds.write_dataset(
+        pa.Table.from_pandas(feature_df, preserve_index=False),
+        base_dir=out_dir,
+        format="parquet",
+        partitioning=PROCESSED_PARTITIONING,
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=100_000,
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            data_page_size=1 << 20,
+            write_statistics=True,
+        ),
+    )
 
     start = feature_df["open_time"].min() if "open_time" in feature_df.columns else None
     end = feature_df["open_time"].max() if "open_time" in feature_df.columns else None
@@ -44,7 +77,7 @@ def main() -> None:
     print(f"Archives: {len(archives)}")
     print(f"Rows: {len(feature_df):,}")
     print(f"Time range: {start} -> {end}")
-    print(f"Saved parquet: {Path(out_file).resolve()}")
+    print(f"Saved parquet dataset under: {out_dir.resolve()}")
 
     # TODO: support CLI args for symbol, interval, and date ranges.
 
@@ -2,14 +2,65 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
+from src.utils import _combine_kline_tables, _decode_binance_zip_buffer
+
 BINANCE_VISION_BASE = "https://data.binance.vision"
 
+MAX_DOWNLOAD_WORKERS = 8
+
+
+def _archive_filename(symbol: str, year: int, month: int | str) -> str:
+    return f"{symbol}-1m-{year}-{int(month):02d}.zip"
+
+
+def _archive_url(symbol: str, filename: str) -> str:
+    return f"{BINANCE_VISION_BASE}/data/spot/monthly/klines/{symbol}/1m/{filename}"
+
+
+def _pooled_session() -> requests.Session:
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=MAX_DOWNLOAD_WORKERS,
+            pool_maxsize=MAX_DOWNLOAD_WORKERS,
+        ),
+    )
+    return session
+
+
+def _download_one(
+    session: requests.Session,
+    url: str,
+    out_path: Path,
+    timeout: int,
+) -> Path | None:
+    """Download one archive to ``out_path``; return the path or None on failure."""
+    try:
+        with session.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            with open(out_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+    except requests.HTTPError as exc:
+        out_path.unlink(missing_ok=True)
+        print(f"Failed to download {out_path.name}: {exc}")
+        return None
+
+    # TODO: validate checksums against Binance provided .CHECKSUM files.
+    return out_path
+
 
 def download_binance_1m_klines(
     symbol: str,
@@ -21,6 +72,9 @@ def download_binance_1m_klines(
 ) -> list[Path]:
     """Download Binance monthly 1m kline zip files to ``data/raw``.
 
+    Months are fetched concurrently over a shared connection pool, so TLS
+    handshakes and keep-alive connections are reused across files.
+
     Args:
         symbol: Trading pair, for example ``BTCUSDT``.
         year: Four-digit year, for example ``2025``.
@@ -42,51 +96,87 @@ def download_binance_1m_klines(
         dest = Path(dest_dir).resolve()
     dest.mkdir(parents=True, exist_ok=True)
 
-    downloaded: list[Path] = []
     clean_symbol = symbol.upper()
 
+    # One directory listing instead of a stat per month; the difference
+    # is large when data/raw lives on a network filesystem.
+    present = {entry.name for entry in dest.iterdir()}
+
+    existing: list[Path] = []
+    to_fetch: list[tuple[str, Path]] = []
     for month in months:
-        month_num = int(month)
-        month_str = f"{month_num:02d}"
-        filename = f"{clean_symbol}-1m-{year}-{month_str}.zip"
-        url = (
-            f"{BINANCE_VISION_BASE}/data/spot/monthly/klines/"
-            f"{clean_symbol}/1m/{filename}"
-        )
+        filename = _archive_filename(clean_symbol, year, month)
+        url = _archive_url(clean_symbol, filename)
         out_path = dest / filename
 
-        if out_path.exists() and not overwrite:
+        if filename in present and not overwrite:
             print(f"Skipping existing file: {out_path}")
-            downloaded.append(out_path)
+            existing.append(out_path)
             continue
+        to_fetch.append((url, out_path))
 
-        print(f"Downloading {url}")
-        try:
-            with requests.get(url, stream=True, timeout=timeout) as response:
-                response.raise_for_status()
-                total = int(response.headers.get("content-length", 0))
-                with (
-                    open(out_path, "wb") as f,
-                    tqdm(
-                        total=total,
-                        unit="B",
-                        unit_scale=True,
-                        desc=filename,
-                        leave=False,
-                    ) as pbar,
-                ):
-                    for chunk in response.iter_content(chunk_size=64 * 1024):
-                        if not chunk:
-                            continue
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-        except requests.HTTPError as exc:
-            if out_path.exists():
-                out_path.unlink(missing_ok=True)
-            print(f"Failed to download {filename}: {exc}")
-            continue
+    if not to_fetch:
+        return existing
+
+    session = _pooled_session()
+
+    fetched: list[Path | None] = []
+    max_workers = min(MAX_DOWNLOAD_WORKERS, len(to_fetch))
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_download_one, session, url, out_path, timeout)
+            for url, out_path in to_fetch
+        ]
+        with tqdm(total=len(futures), unit="file", desc="Downloading") as pbar:
+            for future in futures:
+                fetched.append(future.result())
+                pbar.update(1)
+
+    downloaded = existing + [path for path in fetched if path is not None]
+    return sorted(downloaded)
+
+
+def _fetch_one_table(session: requests.Session, url: str, timeout: int):
+    """Fetch one archive and decode it straight from the response buffer."""
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    return _decode_binance_zip_buffer(response.content, source=url)
+
+
+def fetch_binance_1m_klines(
+    symbol: str,
+    year: int,
+    months: Iterable[int | str],
+    timeout: int = 30,
+) -> pd.DataFrame:
+    """Download and decode Binance monthly 1m klines fully in memory.
+
+    Unlike :func:`download_binance_1m_klines`, nothing is written to disk:
+    each HTTP body is unzipped and parsed directly from its response
+    buffer and the months are combined into one sorted DataFrame. Use
+    this when the data is processed immediately and keeping the raw zips
+    around for reproducibility is not needed.
+    """
+    clean_symbol = symbol.upper()
+    urls = [
+        _archive_url(clean_symbol, _archive_filename(clean_symbol, year, month))
+        for month in months
+    ]
+    if not urls:
+        return _combine_kline_tables([])
 
-        # TODO: validate checksums against Binance provided .CHECKSUM files.
-        downloaded.append(out_path)
+    tables = []
+    max_workers = min(MAX_DOWNLOAD_WORKERS, len(urls))
+    with _pooled_session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_fetch_one_table, session, url, timeout) for url in urls
+        ]
+        with tqdm(total=len(futures), unit="file", desc="Fetching") as pbar:
+            for url, future in zip(urls, futures):
+                try:
+                    tables.append(future.result())
+                except requests.HTTPError as exc:
+                    print(f"Failed to fetch {url}: {exc}")
+                pbar.update(1)
 
-    return downloaded
+    return _combine_kline_tables(tables)
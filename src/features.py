@@ -5,12 +5,194 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba installed
+    _HAVE_NUMBA = False
+
+try:
+    import bottleneck as bn
+
+    _HAVE_BOTTLENECK = True
+except ImportError:  # pragma: no cover - exercised only without bottleneck
+    _HAVE_BOTTLENECK = False
+
+VOLUME_WINDOW = 60
+VOLUME_MIN_PERIODS = 20
+CLOSE_SMA_WINDOW = 30
+CLOSE_SMA_MIN_PERIODS = 10
+
+# Running-sum variance over a constant window leaves rounding-level
+# residue (~1e-16 * mean**2) where pandas computes exactly 0.0, so an
+# exact-zero check misses degenerate windows. Variance below this
+# relative threshold is treated as zero, keeping the baseline
+# behavior of a NaN z-score on constant volume.
+_VAR_REL_EPS = 1e-12
+
+
+if _HAVE_NUMBA:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _elementwise_features(h, l, c, out):
+        """Fill log_return, spread, and hlc3 in one parallel pass.
+
+        ``out`` is a preallocated (n, 3) float32 array; the arithmetic runs
+        in float64 and each store narrows to float32. Row ``i`` only reads
+        ``c[i - 1]`` outside its own index, so rows are independent.
+        """
+        n = c.shape[0]
+        for i in prange(n):
+            ci = c[i] if c[i] != 0.0 else np.nan
+            if i == 0:
+                out[i, 0] = np.nan
+            else:
+                prev = c[i - 1] if c[i - 1] != 0.0 else np.nan
+                out[i, 0] = np.log(ci) - np.log(prev)
+            out[i, 1] = (h[i] - l[i]) / ci
+            out[i, 2] = (h[i] + l[i] + c[i]) / 3.0
+
+    @njit(cache=True)
+    def _rolling_features(c, v, out):
+        """Fill volume_zscore and close_sma_30 with running-sum windows.
+
+        Maintains window sums by adding the entering element and subtracting
+        the leaving one, so the whole pass is O(n) regardless of window size.
+        ``out`` is a preallocated (n, 2) float32 array; the running sums and
+        moments stay in float64 and each store narrows to float32.
+        """
+        n = c.shape[0]
+        v_sum = 0.0
+        v_sumsq = 0.0
+        c_sum = 0.0
+        for i in range(n):
+            v_sum += v[i]
+            v_sumsq += v[i] * v[i]
+            if i >= VOLUME_WINDOW:
+                v_sum -= v[i - VOLUME_WINDOW]
+                v_sumsq -= v[i - VOLUME_WINDOW] * v[i - VOLUME_WINDOW]
+            count = min(i + 1, VOLUME_WINDOW)
+            if count >= VOLUME_MIN_PERIODS:
+                mean = v_sum / count
+                # Sample variance, matching pandas' rolling std (ddof=1).
+                var = (v_sumsq - count * mean * mean) / (count - 1)
+                if var > _VAR_REL_EPS * mean * mean:
+                    std = np.sqrt(var)
+                else:
+                    std = np.nan
+                out[i, 0] = (v[i] - mean) / std
+            else:
+                out[i, 0] = np.nan
+
+            c_sum += c[i]
+            if i >= CLOSE_SMA_WINDOW:
+                c_sum -= c[i - CLOSE_SMA_WINDOW]
+            count = min(i + 1, CLOSE_SMA_WINDOW)
+            if count >= CLOSE_SMA_MIN_PERIODS:
+                out[i, 1] = c_sum / count
+            else:
+                out[i, 1] = np.nan
+
+
+def _rolling_mean_std(
+    x: np.ndarray, window: int, min_periods: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and sample std via cumulative sums, one O(n) pass each.
+
+    Windowed sums are differences of prefix sums, so the cost is independent
+    of the window size. Entries with fewer than ``min_periods`` observations
+    are NaN, matching ``Series.rolling`` semantics on NaN-free input.
+    """
+    n = x.shape[0]
+    cs = np.empty(n + 1, dtype=np.float64)
+    cs2 = np.empty(n + 1, dtype=np.float64)
+    cs[0] = 0.0
+    cs2[0] = 0.0
+    np.cumsum(x, out=cs[1:])
+    np.cumsum(x * x, out=cs2[1:])
+
+    idx = np.arange(n)
+    start = np.maximum(idx + 1 - window, 0)
+    count = idx + 1 - start
+    wsum = cs[idx + 1] - cs[start]
+    wsum2 = cs2[idx + 1] - cs2[start]
+
+    valid = count >= min_periods
+    mean = np.where(valid, wsum / count, np.nan)
+    var = (wsum2 - count * mean * mean) / np.maximum(count - 1, 1)
+    # Same degenerate-window treatment as the numba kernel: variance at
+    # rounding level relative to the mean counts as zero -> NaN std.
+    nondegenerate = var > _VAR_REL_EPS * mean * mean
+    std = np.where(valid & nondegenerate, np.sqrt(np.maximum(var, 0.0)), np.nan)
+    return mean, std
+
+
+def _rolling_mean(x: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling mean via cumulative sums; see :func:`_rolling_mean_std`."""
+    n = x.shape[0]
+    cs = np.empty(n + 1, dtype=np.float64)
+    cs[0] = 0.0
+    np.cumsum(x, out=cs[1:])
+
+    idx = np.arange(n)
+    start = np.maximum(idx + 1 - window, 0)
+    count = idx + 1 - start
+    return np.where(count >= min_periods, (cs[idx + 1] - cs[start]) / count, np.nan)
+
+
+def _compute_features_numpy(out: pd.DataFrame) -> pd.DataFrame:
+    """NumPy fallback used when numba is not installed."""
+    # Branchless zero masking: one vectorized compare + blend instead of
+    # the generic Series.replace machinery.
+    c = out["close"].to_numpy(dtype=np.float64)
+    close = np.where(c == 0.0, np.nan, c)
+
+    # Fused log-return: one log pass plus one in-place subtract on views,
+    # instead of the log -> Series.diff chain and its extra allocations.
+    logc = np.log(close)
+    log_return = np.empty_like(logc)
+    log_return[0] = np.nan
+    np.subtract(logc[1:], logc[:-1], out=log_return[1:])
+    out["log_return"] = log_return.astype(np.float32)
+
+    out["spread"] = ((out["high"] - out["low"]) / close).astype(np.float32)
+
+    # bottleneck's C move_* kernels use the same running-sum trick as the
+    # cumsum helpers but skip their temporary prefix arrays; fall back to
+    # the pure-NumPy formulation when it is not installed.
+    v = out["volume"].to_numpy(dtype=np.float64)
+    if _HAVE_BOTTLENECK:
+        vol_mean = bn.move_mean(v, VOLUME_WINDOW, min_count=VOLUME_MIN_PERIODS)
+        vol_std = bn.move_std(v, VOLUME_WINDOW, min_count=VOLUME_MIN_PERIODS, ddof=1)
+        # bottleneck's running sums leave a tiny nonzero std on constant
+        # windows; apply the same relative-epsilon degeneracy test as the
+        # numba kernel so all paths agree on NaN placement.
+        degenerate = vol_std * vol_std <= _VAR_REL_EPS * vol_mean * vol_mean
+        vol_std = np.where(degenerate, np.nan, vol_std)
+    else:
+        vol_mean, vol_std = _rolling_mean_std(v, VOLUME_WINDOW, VOLUME_MIN_PERIODS)
+    out["volume_zscore"] = ((v - vol_mean) / vol_std).astype(np.float32)
+
+    out["hlc3"] = (
+        (out["high"] + out["low"] + out["close"]) / 3.0
+    ).astype(np.float32)
+    if _HAVE_BOTTLENECK:
+        sma = bn.move_mean(c, CLOSE_SMA_WINDOW, min_count=CLOSE_SMA_MIN_PERIODS)
+    else:
+        sma = _rolling_mean(c, CLOSE_SMA_WINDOW, CLOSE_SMA_MIN_PERIODS)
+    out["close_sma_30"] = sma.astype(np.float32)
+    return out
+
 
 def compute_features(df: pd.DataFrame) -> pd.DataFrame:
     """Compute a small baseline feature set from raw OHLCV data.
 
     Expected input columns include:
     ``open``, ``high``, ``low``, ``close``, ``volume``.
+
+    Returns a new DataFrame holding the timestamp columns (when present),
+    the OHLCV columns, and the derived feature columns.
     """
     required = {"open", "high", "low", "close", "volume"}
     missing = required - set(df.columns)
@@ -18,22 +200,37 @@ def compute_features(df: pd.DataFrame) -> pd.DataFrame:
         missing_list = ", ".join(sorted(missing))
         raise ValueError(f"DataFrame is missing required columns: {missing_list}")
 
-    out = df.copy()
-
     numeric_cols = ["open", "high", "low", "close", "volume"]
-    out[numeric_cols] = out[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    o, h, l, c, v = (df[col].to_numpy(dtype=np.float64) for col in numeric_cols)
+
+    # Build a fresh frame instead of copying the full input: timestamp
+    # columns are reused by reference and everything else is the already
+    # extracted float64 arrays, so peak memory stays at one set of columns.
+    out = pd.DataFrame(
+        {col: df[col] for col in ("open_time", "close_time") if col in df.columns}
+    )
+    for col, arr in zip(numeric_cols, (o, h, l, c, v)):
+        out[col] = arr
 
-    close = out["close"].replace(0.0, np.nan)
-    out["log_return"] = np.log(close).diff()
-    out["spread"] = (out["high"] - out["low"]) / close
+    if not _HAVE_NUMBA:
+        return _compute_features_numpy(out)
 
-    rolling_window = 60
-    vol_mean = out["volume"].rolling(rolling_window, min_periods=20).mean()
-    vol_std = out["volume"].rolling(rolling_window, min_periods=20).std()
-    out["volume_zscore"] = (out["volume"] - vol_mean) / vol_std.replace(0.0, np.nan)
+    # Feature columns are stored as float32: ~7 significant digits is
+    # plenty for returns, spreads, and z-scores, and it halves the memory
+    # and parquet footprint of the feature frame. The arithmetic inside
+    # the kernels stays in float64 (log-return differencing in float32
+    # loses most of its precision to cancellation); only the stored
+    # values are narrowed.
+    elementwise = np.empty((len(df), 3), dtype=np.float32)
+    rolling = np.empty((len(df), 2), dtype=np.float32)
+    _elementwise_features(h, l, c, elementwise)
+    _rolling_features(c, v, rolling)
 
-    out["hlc3"] = (out["high"] + out["low"] + out["close"]) / 3.0
-    out["close_sma_30"] = out["close"].rolling(30, min_periods=10).mean()
+    out["log_return"] = elementwise[:, 0]
+    out["spread"] = elementwise[:, 1]
+    out["volume_zscore"] = rolling[:, 0]
+    out["hlc3"] = elementwise[:, 2]
+    out["close_sma_30"] = rolling[:, 1]
 
     # TODO: add regime-aware and multi-scale volatility features.
     return out
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import io
+import mmap
+from functools import lru_cache
 from pathlib import Path
 from zipfile import ZipFile
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 
 # -----------------------------------------------------------------------------
@@ -23,21 +33,54 @@ BINANCE_KLINE_COLUMNS = [
     "number_of_trades",
     "taker_buy_base_asset_volume",
     "taker_buy_quote_asset_volume",
-    "ignore",
 ]
 
+# The raw CSV carries a trailing "ignore" column (always 0) that nothing
+# downstream uses; it is named here so the parser can address the file's
+# full width, then dropped via usecols at read time.
+_RAW_CSV_COLUMNS = BINANCE_KLINE_COLUMNS + ["ignore"]
+
+# Declaring dtypes up front lets the C parser materialize typed arrays
+# directly instead of needing a second coercion pass after the read.
+# number_of_trades is int32: monthly 1m counts stay far below 2**31.
+BINANCE_KLINE_DTYPES = {
+    "open_time": "int64",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "float64",
+    "close_time": "int64",
+    "quote_asset_volume": "float64",
+    "number_of_trades": "int32",
+    "taker_buy_base_asset_volume": "float64",
+    "taker_buy_quote_asset_volume": "float64",
+}
+
+# Arrow-side mirror of the same schema for the pyarrow CSV reader.
+_ARROW_CSV_TYPES = {
+    name: pa.from_numpy_dtype(np.dtype(dtype))
+    for name, dtype in BINANCE_KLINE_DTYPES.items()
+}
+
 
 # -----------------------------------------------------------------------------
 # Project Paths
 # -----------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def project_root() -> Path:
     """Return the repository root directory."""
     return Path(__file__).resolve().parents[1]
 
 
+@lru_cache(maxsize=None)
 def data_path(kind: str) -> Path:
-    """Return data directory path by kind: 'raw' or 'processed'."""
+    """Return data directory path by kind: 'raw' or 'processed'.
+
+    Cached per kind: the path resolution and mkdir only run once per
+    process, so repeated helper calls cost no filesystem work.
+    """
     if kind not in {"raw", "processed"}:
         raise ValueError("kind must be either 'raw' or 'processed'")
     path = project_root() / "data" / kind
@@ -49,87 +92,172 @@ def data_path(kind: str) -> Path:
 # Binance Zip Readers
 # -----------------------------------------------------------------------------
 
-def read_binance_zip(zip_path: str | Path) -> pd.DataFrame:
-    """
-    Load a single Binance kline zip archive into a DataFrame.
-    Ensures:
-        - Correct column ordering
-        - Strict dtype enforcement
-        - Proper timestamp conversion
-        - Sorting by open_time
+def _read_binance_zip_table(zip_path: str | Path, cache: bool = True) -> pa.Table:
+    """Load one Binance kline zip archive as an Arrow table.
+
+    Internal workhorse behind :func:`read_binance_zip`; keeping the data in
+    Arrow lets multi-file loads concatenate and sort without materializing
+    intermediate DataFrames.
     """
     zip_path = Path(zip_path)
+    cache_path = zip_path.with_suffix(".parquet")
+
+    if (
+        cache
+        and cache_path.exists()
+        and cache_path.stat().st_mtime >= zip_path.stat().st_mtime
+    ):
+        return pq.read_table(cache_path, memory_map=True)
+
+    with (
+        zip_path.open("rb") as f,
+        # mmap the archive so the compressed bytes come straight from the
+        # OS page cache in one slurp instead of buffered read syscalls.
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        table = _decode_binance_zip_buffer(mm, source=zip_path)
+
+    if cache:
+        pq.write_table(table, cache_path, compression="zstd", row_group_size=200_000)
+
+    return table
+
 
-    with ZipFile(zip_path) as zf:
+def _decode_binance_zip_buffer(buf, source: str | Path = "<buffer>") -> pa.Table:
+    """Decode an in-memory Binance kline zip archive into an Arrow table.
+
+    ``buf`` is any bytes-like object holding the full archive; ``source``
+    is only used in error messages.
+    """
+    # BytesIO is needed because bytes / mmap objects are not seekable
+    # file-likes as far as ZipFile is concerned.
+    with ZipFile(io.BytesIO(buf)) as zf:
         csv_members = [name for name in zf.namelist() if name.endswith(".csv")]
         if not csv_members:
-            raise ValueError(f"No CSV file found inside archive: {zip_path}")
-
-        with zf.open(csv_members[0]) as fh:
-            df = pd.read_csv(
-                fh,
-                header=None,
-                names=BINANCE_KLINE_COLUMNS,
-                dtype={
-                    "open_time": "int64",
-                    "close_time": "int64",
-                },
-            )
+            raise ValueError(f"No CSV file found inside archive: {source}")
+
+        # Decompress the member in one shot rather than handing the
+        # ZipExtFile to the parser: its small chunked reads through the
+        # zip decoder trigger repeated buffer reallocations.
+        raw = zf.read(csv_members[0])
+
+    # pyarrow's CSV reader parses the declared schema with all cores and
+    # yields the Arrow table directly — no DataFrame intermediate and no
+    # per-column conversion passes afterwards.
+    table = pacsv.read_csv(
+        pa.BufferReader(raw),
+        read_options=pacsv.ReadOptions(
+            column_names=_RAW_CSV_COLUMNS,
+            block_size=4 << 20,
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types=_ARROW_CSV_TYPES,
+            include_columns=BINANCE_KLINE_COLUMNS,
+        ),
+    )
 
     # ---- Convert timestamps (CRITICAL) ----
-    df["open_time"] = pd.to_datetime(df["open_time"], unit="us", utc=True)
-    df["close_time"] = pd.to_datetime(df["close_time"], unit="us", utc=True)
-
-
-    # ---- Force numeric types safely ----
-    numeric_cols = [
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume",
-        "quote_asset_volume",
-        "number_of_trades",
-        "taker_buy_base_asset_volume",
-        "taker_buy_quote_asset_volume",
-    ]
-
-    df[numeric_cols] = df[numeric_cols].apply(
-        pd.to_numeric, errors="coerce"
-    )
+    # The columns are guaranteed int64 microseconds: one vectorized
+    # multiply to nanoseconds, then reinterpret as tz-aware timestamps.
+    for col in ("open_time", "close_time"):
+        idx = table.schema.get_field_index(col)
+        nanos = pc.multiply(table.column(col), pa.scalar(1000, pa.int64()))
+        table = table.set_column(
+            idx, col, nanos.cast(pa.timestamp("ns", tz="UTC"))
+        )
 
     # ---- Basic sanity check ----
-    if df["open_time"].dt.year.min() < 2017:
+    min_open = pc.min(table.column("open_time")).as_py()
+    if min_open is None or min_open.year < 2017:
         raise ValueError("Timestamp conversion failed — check data integrity.")
 
-    return df.sort_values("open_time").reset_index(drop=True)
+    # Binance monthly archives are emitted in ascending open_time order,
+    # so the common case is a single monotonicity check; only fall back
+    # to an actual sort on out-of-order data.
+    ts = table.column("open_time").to_numpy(zero_copy_only=False)
+    if len(ts) > 1 and not np.all(ts[:-1] <= ts[1:]):
+        table = table.sort_by([("open_time", "ascending")])
 
+    return table
 
-def load_binance_zip_files(paths: list[str | Path]) -> pd.DataFrame:
-    """Load and concatenate multiple Binance zip archives."""
-    frames = [read_binance_zip(path) for path in paths]
 
-    if not frames:
+def read_binance_zip(zip_path: str | Path, cache: bool = True) -> pd.DataFrame:
+    """
+    Load a single Binance kline zip archive into a DataFrame.
+    Ensures:
+        - Correct column ordering
+        - Strict dtype enforcement
+        - Proper timestamp conversion
+        - Sorting by open_time
+
+    When ``cache`` is True, the decoded frame is persisted as a parquet
+    sidecar next to the zip and reused on later runs while it is at least
+    as fresh as the archive.
+    """
+    table = _read_binance_zip_table(zip_path, cache=cache)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _combine_kline_tables(tables: list[pa.Table]) -> pd.DataFrame:
+    """Concatenate per-archive Arrow tables into one sorted DataFrame."""
+    if not tables:
         return pd.DataFrame(columns=BINANCE_KLINE_COLUMNS)
 
-    combined = pd.concat(frames, ignore_index=True)
-    return combined.sort_values("open_time").reset_index(drop=True)
+    # Arrow concatenation just stitches chunks together instead of
+    # reallocating every column the way pd.concat does; the single
+    # conversion to pandas happens at the API boundary.
+    combined = pa.concat_tables(tables, promote_options="default")
+
+    # Per-file tables are sorted and callers pass files chronologically,
+    # so the concatenation is normally already globally ordered.
+    ts = combined.column("open_time").to_numpy(zero_copy_only=False)
+    if len(ts) > 1 and not np.all(ts[:-1] <= ts[1:]):
+        combined = combined.sort_by([("open_time", "ascending")])
+
+    return combined.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_binance_zip_files(paths: list[str | Path]) -> pd.DataFrame:
+    """Load and concatenate multiple Binance zip archives."""
+    return _combine_kline_tables([_read_binance_zip_table(path) for path in paths])
 
 
 # -----------------------------------------------------------------------------
 # Parquet Loader
 # -----------------------------------------------------------------------------
 
-def load_multiple_parquets(paths: list[str | Path]) -> pd.DataFrame:
-    """Load and concatenate multiple parquet files."""
-    frames = [pd.read_parquet(path) for path in paths]
-
-    if not frames:
+def load_multiple_parquets(
+    paths: list[str | Path],
+    columns: list[str] | None = None,
+    time_range: tuple | None = None,
+) -> pd.DataFrame:
+    """Load and concatenate multiple parquet files.
+
+    Args:
+        paths: Parquet files to load.
+        columns: Optional column projection; only these columns are read
+            and decoded. Defaults to all columns.
+        time_range: Optional ``(lo, hi)`` bounds (inclusive) applied to
+            ``open_time``. Row groups entirely outside the range are
+            pruned via parquet statistics before any decode happens.
+    """
+    if not paths:
         return pd.DataFrame()
 
-    combined = pd.concat(frames, ignore_index=True)
-
-    if "open_time" in combined.columns:
-        combined = combined.sort_values("open_time")
-
-    return combined.reset_index(drop=True)
+    if time_range is not None:
+        lo, hi = time_range
+        dataset = ds.dataset([Path(p) for p in paths], format="parquet")
+        combined = dataset.to_table(
+            columns=columns,
+            filter=(ds.field("open_time") >= lo) & (ds.field("open_time") <= hi),
+        )
+    else:
+        tables = [
+            pq.read_table(path, columns=columns, memory_map=True) for path in paths
+        ]
+        combined = pa.concat_tables(tables, promote_options="default")
+
+    if "open_time" in combined.column_names:
+        combined = combined.sort_by([("open_time", "ascending")])
+
+    return combined.to_pandas(split_blocks=True, self_destruct=True)